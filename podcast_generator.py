@@ -5,19 +5,113 @@ Generates a podcast script using LLM and converts it to audio using Eleven Labs
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import os
 import sys
 import re
-from typing import List, Dict, Tuple
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional, AsyncIterator, AsyncIterable
+import httpx
 import openai
-from elevenlabs import ElevenLabs
+from elevenlabs import AsyncElevenLabs
 from pydub import AudioSegment
-import io
 from dotenv import load_dotenv
 
+try:
+    # Faster libuv-based event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Default Eleven Labs model; flash targets ~75ms to first audio chunk
+TTS_MODEL = "eleven_flash_v2_5"
+
+# Models that accept language_code; Eleven Labs rejects it for any other model
+_LANGUAGE_CODE_MODELS = {"eleven_turbo_v2_5", "eleven_flash_v2_5"}
+
+# Raw PCM format requested from Eleven Labs (16-bit mono); 24 kHz is the
+# highest PCM rate every plan can request, 44.1 kHz needs the Pro tier
+PCM_FRAME_RATE = 24000
+PCM_SAMPLE_WIDTH = 2
+PCM_CHANNELS = 1
+
+# Static instructions go in the system message so every request shares the
+# same prefix, which lets providers serve it from their prompt cache
+_SYSTEM_PROMPT = """You are a professional podcast script writer. Follow the format requirements exactly.
+
+IMPORTANT REQUIREMENTS:
+- The script must contain EXACTLY 3 exchanges from the HOST and EXACTLY 3 exchanges from the GUEST
+- Total of 6 lines of dialogue
+- Each line should be substantial (2-3 sentences)
+- Format each line as either "HOST: [dialogue]" or "GUEST: [dialogue]"
+- Make it conversational and engaging
+- The HOST should introduce the topic and guide the conversation
+- The GUEST should provide expertise and insights
+
+Example format:
+HOST: Welcome to our podcast! Today we're discussing [topic]. I'm excited to explore this fascinating subject with our expert guest.
+GUEST: Thank you for having me! This is indeed a crucial topic that affects many aspects of our daily lives.
+HOST: Let's dive right in. Can you explain the fundamental concepts behind [topic] for our listeners?
+GUEST: Absolutely. The key thing to understand is that [topic] involves several interconnected elements that work together.
+HOST: That's really insightful. What do you think the future holds for this field?
+GUEST: I believe we're going to see significant developments in the coming years, particularly in areas like innovation and practical applications.
+"""
+
+# Per-request part of the prompt
+_SCRIPT_PROMPT = """Now create a similar script for the topic: "{topic}"
+Write the dialogue in the language with ISO 639-1 code "{language}", keeping the HOST: and GUEST: labels in English.
+"""
+
+# A dialogue line: "HOST: ..." or "GUEST: ..."
+_LINE_RE = re.compile(r'^(HOST|GUEST):\s*(.*)$')
+
+# Whitespace following a sentence-ending punctuation mark
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Words ending in a period that do not end a sentence
+_ABBREVIATIONS = {
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr.", "st.", "mt.",
+    "vs.", "etc.", "inc.", "ltd.", "co.", "corp.", "no.", "approx."
+}
+
+# Initials and dotted acronyms such as "J." or "U.S."
+_INITIALISM_RE = re.compile(r'^(?:[a-z]\.)+$')
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences, keeping abbreviations attached to the words that follow"""
+    sentences = []
+    for fragment in _SENTENCE_RE.split(text):
+        if not fragment:
+            continue
+        
+        last_word = sentences[-1].rsplit(None, 1)[-1].lower() if sentences else ""
+        if last_word in _ABBREVIATIONS or _INITIALISM_RE.match(last_word):
+            sentences[-1] += " " + fragment
+        else:
+            sentences.append(fragment)
+    return sentences
+
+
+@functools.lru_cache(maxsize=None)
+def _silence(duration_ms: int, frame_rate: int, channels: int, sample_width: int) -> bytes:
+    """Return zero-filled PCM for a pause, built once per distinct format"""
+    return b"\x00" * (duration_ms * frame_rate * channels * sample_width // 1000)
+
+
+class PodcastGenerationError(Exception):
+    """Raised inside the async pipeline once a step has reported its own error"""
+
 
 class PodcastGenerator:
-    def __init__(self, llm_provider: str = "openai", llm_model: str = "gpt-3.5-turbo"):
+    def __init__(self, llm_provider: str = "openai", llm_model: str = "gpt-3.5-turbo", use_cache: bool = True,
+                 language: str = "en", tts_model: str = TTS_MODEL, max_tts_requests: int = 3):
         """Initialize the podcast generator with API clients"""
         # Load environment variables
         load_dotenv()
@@ -29,23 +123,48 @@ class PodcastGenerator:
         self.llm_provider = llm_provider
         self.llm_model = llm_model
         
+        # ISO 639-1 language code for the script and speech; pinning it skips
+        # language detection on every TTS request
+        self.language = language
+        
         if llm_provider == "openai":
-            self.openai_client = openai.OpenAI(
+            self.openai_client = openai.AsyncOpenAI(
                 api_key=os.getenv("OPENAI_API_KEY")
             )
         elif llm_provider == "grok":
             # For Grok, you would need to implement the specific API client
             # This is a placeholder - you'd need to adapt based on Grok's API
-            self.openai_client = openai.OpenAI(
+            self.openai_client = openai.AsyncOpenAI(
                 api_key=os.getenv("GROK_API_KEY"),
                 base_url="https://api.x.ai/v1"  # Grok's API endpoint
             )
         
-        # Initialize Eleven Labs client
-        self.elevenlabs_client = ElevenLabs(
-            api_key=os.getenv("ELEVENLABS_API_KEY")
+        self.tts_model = tts_model
+        
+        # Cap on simultaneous TTS requests, kept within the Eleven Labs plan's
+        # concurrency limit
+        self.max_tts_requests = max_tts_requests
+        
+        # Initialize Eleven Labs client on a shared keep-alive connection pool
+        # so every segment request after the first skips the TCP/TLS handshake;
+        # generate_podcast closes the pool once all audio has been generated.
+        # The SDK takes its timeout from a custom client, so keep its 60 s
+        # default rather than httpx's 5 s, which cuts off long syntheses
+        self.elevenlabs_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10),
+            timeout=httpx.Timeout(60.0)
+        )
+        self.elevenlabs_client = AsyncElevenLabs(
+            api_key=os.getenv("ELEVENLABS_API_KEY"),
+            httpx_client=self.elevenlabs_http_client
         )
         
+        # Cache scripts and audio segments on disk so repeated topics skip the APIs
+        self.cache_dir = Path("~/.cache/podcast_gen").expanduser() if use_cache else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
         # Default voice IDs (you can replace these with your preferred voices)
         self.default_host_voice = "21m00Tcm4TlvDq8ikWAM"  # Rachel
         self.default_guest_voice = "AZnzlk1XvdvUeBnXmlld"  # Domi
@@ -70,196 +189,379 @@ class PodcastGenerator:
         
         print("✅ API keys validated successfully")
     
-    def generate_script(self, topic: str) -> str:
-        """Generate podcast script using LLM"""
+    def get_cache_path(self, suffix: str, *key_parts: str) -> Optional[Path]:
+        """Return the cache file for the given key parts, or None if caching is disabled"""
+        if not self.cache_dir:
+            return None
+        
+        key = hashlib.sha256(":".join(key_parts).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}{suffix}"
+    
+    def write_cache(self, cache_file: Path, data: bytes):
+        """Atomically store data in the cache so a partial write is never replayed"""
+        # Write to a temporary file next to the target, then rename it into place
+        fd, temp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, cache_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    
+    async def generate_script(self, topic: str) -> AsyncIterator[str]:
+        """Stream podcast script from the LLM, yielding text as soon as it arrives"""
         print(f"🎯 Generating script for topic: '{topic}'...")
         
-        prompt = f"""Create a podcast script on the topic: "{topic}"
-
-IMPORTANT REQUIREMENTS:
-- The script must contain EXACTLY 3 exchanges from the HOST and EXACTLY 3 exchanges from the GUEST
-- Total of 6 lines of dialogue
-- Each line should be substantial (2-3 sentences)
-- Format each line as either "HOST: [dialogue]" or "GUEST: [dialogue]"
-- Make it conversational and engaging
-- The HOST should introduce the topic and guide the conversation
-- The GUEST should provide expertise and insights
-
-Example format:
-HOST: Welcome to our podcast! Today we're discussing [topic]. I'm excited to explore this fascinating subject with our expert guest.
-GUEST: Thank you for having me! This is indeed a crucial topic that affects many aspects of our daily lives.
-HOST: Let's dive right in. Can you explain the fundamental concepts behind [topic] for our listeners?
-GUEST: Absolutely. The key thing to understand is that [topic] involves several interconnected elements that work together.
-HOST: That's really insightful. What do you think the future holds for this field?
-GUEST: I believe we're going to see significant developments in the coming years, particularly in areas like innovation and practical applications.
-
-Now create a similar script for the topic: "{topic}"
-"""
+        # Reuse a previously validated script for the same model and topic
+        cache_file = self.get_cache_path(".txt", self.llm_provider, self.llm_model, self.language, topic)
+        if cache_file and cache_file.exists():
+            print("♻️ Using cached script")
+            yield cache_file.read_text(encoding="utf-8")
+            return
+        
+        prompt = _SCRIPT_PROMPT.format(topic=topic, language=self.language)
         
         try:
-            response = self.openai_client.chat.completions.create(
+            start_time = time.perf_counter()
+            stream = await self.openai_client.chat.completions.create(
                 model=self.llm_model,
                 messages=[
-                    {"role": "system", "content": "You are a professional podcast script writer. Follow the format requirements exactly."},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=1000,
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
             
-            script = response.choices[0].message.content.strip()
+            first_token = True
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                
+                if first_token:
+                    print(f"✍️ First tokens received after {time.perf_counter() - start_time:.2f}s")
+                    first_token = False
+                
+                yield chunk.choices[0].delta.content
+            
             print("✅ Script generated successfully")
-            return script
             
         except Exception as e:
             print(f"❌ Error generating script: {str(e)}")
-            sys.exit(1)
+            raise PodcastGenerationError()
     
-    def parse_script(self, script: str) -> List[Dict[str, str]]:
-        """Parse the script into structured dialogue"""
-        print("📝 Parsing script...")
+    def parse_line(self, line: str) -> Optional[Dict[str, str]]:
+        """Parse a single script line into a dialogue entry, or None if it is not dialogue"""
+        match = _LINE_RE.match(line.strip())
+        if not match:
+            return None
         
-        lines = script.strip().split('\n')
-        dialogue = []
+        return {
+            "speaker": match.group(1),
+            "text": match.group(2).strip()
+        }
+    
+    async def iter_dialogue(self, stream: AsyncIterable[str], script_lines: List[str]) -> AsyncIterator[Dict[str, str]]:
+        """Parse streamed script text into dialogue entries as each line completes"""
+        buffer = ""
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Match HOST: or GUEST: prefixes
-            if line.startswith("HOST:"):
-                dialogue.append({
-                    "speaker": "HOST",
-                    "text": line[5:].strip()
-                })
-            elif line.startswith("GUEST:"):
-                dialogue.append({
-                    "speaker": "GUEST", 
-                    "text": line[6:].strip()
-                })
+        async for text in stream:
+            # Parse every complete line, keep the unfinished tail buffered
+            buffer += text
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                script_lines.append(line)
+                entry = self.parse_line(line)
+                if entry:
+                    yield entry
         
-        # Validate we have exactly 6 lines (3 HOST, 3 GUEST)
-        host_lines = [d for d in dialogue if d["speaker"] == "HOST"]
-        guest_lines = [d for d in dialogue if d["speaker"] == "GUEST"]
+        if buffer:
+            script_lines.append(buffer)
+            entry = self.parse_line(buffer)
+            if entry:
+                yield entry
+    
+    def validate_dialogue(self, counts: Dict[str, int], script: str):
+        """Validate the per-speaker line counts have the expected structure"""
+        host_count = counts["HOST"]
+        guest_count = counts["GUEST"]
         
-        if len(host_lines) != 3 or len(guest_lines) != 3:
-            print(f"❌ Error: Script parsing failed. Expected 3 HOST and 3 GUEST lines, got {len(host_lines)} HOST and {len(guest_lines)} GUEST lines")
+        # Validate we have exactly 6 lines (3 HOST, 3 GUEST)
+        if host_count != 3 or guest_count != 3:
+            print(f"❌ Error: Script parsing failed. Expected 3 HOST and 3 GUEST lines, got {host_count} HOST and {guest_count} GUEST lines")
             print("Raw script content:")
             print(script)
-            sys.exit(1)
+            raise PodcastGenerationError()
         #CHECK: Ensure we have exactly 6 dialogue lines
-        if len(dialogue) != 6:
-            print(f"❌ Error: Expected exactly 6 dialogue lines, got {len(dialogue)}")
-            sys.exit(1)
+        if host_count + guest_count != 6:
+            print(f"❌ Error: Expected exactly 6 dialogue lines, got {host_count + guest_count}")
+            raise PodcastGenerationError()
         
-        print(f"✅ Script parsed successfully: {len(host_lines)} HOST lines, {len(guest_lines)} GUEST lines")
-        return dialogue
+        print(f"✅ Script parsed successfully: {host_count} HOST lines, {guest_count} GUEST lines")
     
-    def save_script(self, script: str, output_file: str):
+    async def stream_dialogue(self, topic: str, output_script_file: str, queue: asyncio.Queue) -> asyncio.Task:
+        """Push dialogue entries onto the queue as the script streams in; returns the pending script save"""
+        print("📝 Parsing script...")
+        
+        script_lines = []
+        counts = {"HOST": 0, "GUEST": 0}
+        
+        async for entry in self.iter_dialogue(self.generate_script(topic), script_lines):
+            speaker = entry["speaker"]
+            counts[speaker] += 1
+            
+            # Stop before paying for TTS on a script that can no longer be valid
+            if counts[speaker] > 3 or counts["HOST"] + counts["GUEST"] > 6:
+                script = "\n".join(script_lines).strip()
+                print(f"❌ Error: Script parsing failed. Expected 3 HOST and 3 GUEST lines, got more than 3 {speaker} lines")
+                print("Raw script content:")
+                print(script)
+                
+                # Keep the malformed script on disk for debugging
+                await self.save_script(script, output_script_file)
+                raise PodcastGenerationError()
+            
+            await queue.put(entry)
+        
+        # Save the complete script in a worker thread, off the critical path,
+        # and validate it while the write is in flight
+        script = "\n".join(script_lines).strip()
+        script_saved = asyncio.create_task(self.save_script(script, output_script_file))
+        try:
+            self.validate_dialogue(counts, script)
+        except PodcastGenerationError:
+            # Let the invalid script reach the disk before giving up
+            await asyncio.gather(script_saved, return_exceptions=True)
+            raise
+        
+        # Only cache scripts that passed validation
+        cache_file = self.get_cache_path(".txt", self.llm_provider, self.llm_model, self.language, topic)
+        if cache_file:
+            self.write_cache(cache_file, script.encode("utf-8"))
+        
+        # Signal the TTS worker that no more lines are coming
+        await queue.put(None)
+        return script_saved
+    
+    def write_script(self, script: str, output_file: str):
+        """Write the raw script to a text file"""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(script)
+    
+    async def save_script(self, script: str, output_file: str):
         """Save the raw script to a text file"""
         print(f"💾 Saving script to {output_file}...")
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(script)
+            # Write in a worker thread; progress is reported from the event
+            # loop so it doesn't interleave with the TTS output
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.write_script, script, output_file)
             print(f"✅ Script saved to {output_file}")
         except Exception as e:
             print(f"❌ Error saving script: {str(e)}")
-            sys.exit(1)
+            raise PodcastGenerationError()
     
-    def generate_audio_segment(self, text: str, voice_id: str, speaker: str) -> AudioSegment:
-        """Generate audio for a single dialogue segment"""
-        print(f"🎤 Converting {speaker} dialogue to speech...")
+    async def generate_audio_segment(self, text: str, voice_id: str, speaker: str,
+                                     previous_text: Optional[str] = None, next_text: Optional[str] = None,
+                                     semaphore: Optional[asyncio.Semaphore] = None) -> bytes:
+        """Generate raw PCM audio for a single dialogue segment"""
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_tts_requests)
+        model_id = self.tts_model
+        output_format = f"pcm_{PCM_FRAME_RATE}"
+        cache_file = self.get_cache_path(".pcm", voice_id, model_id, output_format, self.language,
+                                         previous_text or "", text, next_text or "")
+        
+        # Pin the language where the model supports it, and pass surrounding
+        # text so the model carries prosody across split sentences
+        options = {}
+        if model_id in _LANGUAGE_CODE_MODELS:
+            options["language_code"] = self.language
+        if previous_text:
+            options["previous_text"] = previous_text
+        if next_text:
+            options["next_text"] = next_text
         
         try:
-            # Generate audio using Eleven Labs
-            audio_bytes = self.elevenlabs_client.generate(
-                text=text,
-                voice=voice_id,
-                model="eleven_monolingual_v1"
-            )
+            if cache_file and cache_file.exists():
+                print(f"♻️ Using cached {speaker} audio")
+                audio_bytes = cache_file.read_bytes()
+            else:
+                print(f"🎤 Converting {speaker} dialogue to speech...")
+                
+                # Stream audio from Eleven Labs, collecting chunks as they arrive
+                audio_bytes = bytearray()
+                async with semaphore:
+                    async for chunk in self.elevenlabs_client.text_to_speech.stream(
+                        voice_id,
+                        text=text,
+                        model_id=model_id,
+                        optimize_streaming_latency=3,
+                        output_format=output_format,
+                        **options
+                    ):
+                        audio_bytes.extend(chunk)
+                
+                if cache_file:
+                    self.write_cache(cache_file, bytes(audio_bytes))
             
-            # Convert bytes to AudioSegment
-            audio_segment = AudioSegment.from_file(io.BytesIO(audio_bytes), format="mp3")
-            return audio_segment
+            # Segments are joined byte-for-byte, so drop any partial trailing
+            # frame that would shift every sample after it
+            frame_width = PCM_SAMPLE_WIDTH * PCM_CHANNELS
+            return bytes(audio_bytes[:len(audio_bytes) - len(audio_bytes) % frame_width])
             
         except Exception as e:
             print(f"❌ Error generating audio for {speaker}: {str(e)}")
-            sys.exit(1)
+            raise PodcastGenerationError()
     
-    def generate_full_audio(self, dialogue: List[Dict[str, str]], host_voice: str, guest_voice: str) -> AudioSegment:
+    async def generate_line_audio(self, text: str, voice_id: str, speaker: str,
+                                  semaphore: Optional[asyncio.Semaphore] = None) -> bytes:
+        """Generate raw PCM audio for one dialogue line"""
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_tts_requests)
+        
+        # TTS latency grows with text length, so synthesize each sentence in
+        # parallel and stitch them back together with a short breath between
+        sentences = _split_sentences(text)
+        parts = await asyncio.gather(*[
+            self.generate_audio_segment(
+                sentence, voice_id, speaker,
+                previous_text=" ".join(sentences[:i]),
+                next_text=" ".join(sentences[i + 1:]),
+                semaphore=semaphore
+            )
+            for i, sentence in enumerate(sentences)
+        ])
+        
+        breath_pcm = _silence(100, PCM_FRAME_RATE, PCM_CHANNELS, PCM_SAMPLE_WIDTH)
+        return breath_pcm.join(parts)
+    
+    async def generate_full_audio(self, dialogue: asyncio.Queue, host_voice: str, guest_voice: str) -> AudioSegment:
         """Generate complete podcast audio by combining all segments"""
         print("🎵 Generating complete podcast audio...")
         
-        combined_audio = AudioSegment.empty()
+        # One semaphore per run, shared by every line's sentence requests
+        tts_semaphore = asyncio.Semaphore(self.max_tts_requests)
         
-        for i, line in enumerate(dialogue):
-            speaker = line["speaker"]
-            text = line["text"]
-            voice_id = host_voice if speaker == "HOST" else guest_voice
-            
-            print(f"   Processing line {i+1}/6: {speaker}")
-            
-            # Generate audio for this line
-            audio_segment = self.generate_audio_segment(text, voice_id, speaker)
-            
-            # Add a short pause between speakers (0.5 seconds)
-            if i > 0:
-                pause = AudioSegment.silent(duration=500)
-                combined_audio += pause
+        tasks = []
+        try:
+            while True:
+                line = await dialogue.get()
+                if line is None:
+                    break
+                
+                speaker = line["speaker"]
+                text = line["text"]
+                voice_id = host_voice if speaker == "HOST" else guest_voice
+                
+                print(f"   Processing line {len(tasks)+1}/6: {speaker}")
+                
+                # Start audio generation for this line right away
+                tasks.append(asyncio.create_task(self.generate_line_audio(text, voice_id, speaker, tts_semaphore)))
             
-            combined_audio += audio_segment
+            # Run all TTS requests concurrently; gather keeps results in dialogue order
+            segments = await asyncio.gather(*tasks)
+        finally:
+            # If a line failed or the pipeline was cancelled, stop the requests
+            # still in flight instead of leaving them running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Add a short pause between speakers (0.5 seconds)
+        silence_pcm = _silence(500, PCM_FRAME_RATE, PCM_CHANNELS, PCM_SAMPLE_WIDTH)
+        
+        # Every segment shares the same PCM format, so join the raw bytes in
+        # one pass and wrap them in the only AudioSegment of the pipeline
+        combined_audio = AudioSegment(
+            data=silence_pcm.join(segments),
+            sample_width=PCM_SAMPLE_WIDTH,
+            frame_rate=PCM_FRAME_RATE,
+            channels=PCM_CHANNELS
+        )
         
         print("✅ Complete audio generated successfully")
         return combined_audio
     
-    def save_audio(self, audio: AudioSegment, output_file: str):
+    def export_mp3(self, audio: AudioSegment, output_file: str):
+        """Encode raw PCM to MP3 by piping it straight into ffmpeg"""
+        # pydub's export writes a temporary WAV, encodes into a second temp
+        # file and copies that over; the PCM is already in memory, so skip both
+        command = [
+            AudioSegment.converter, "-y",
+            "-f", f"s{8 * audio.sample_width}le",
+            "-ar", str(audio.frame_rate),
+            "-ac", str(audio.channels),
+            "-i", "pipe:0",
+            "-acodec", "libmp3lame",
+            "-f", "mp3", output_file
+        ]
+        result = subprocess.run(command, input=audio.raw_data, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with code {result.returncode}: {result.stderr.decode(errors='ignore').strip()}")
+    
+    async def save_audio(self, audio: AudioSegment, output_file: str):
         """Save the combined audio to file"""
         print(f"💾 Saving audio to {output_file}...")
         
         try:
             # Determine format from file extension
             if output_file.lower().endswith('.wav'):
-                audio.export(output_file, format="wav")
+                export = functools.partial(audio.export, output_file, format="wav")
             elif output_file.lower().endswith('.mp3'):
-                audio.export(output_file, format="mp3")
+                export = functools.partial(self.export_mp3, audio, output_file)
             else:
                 # Default to mp3 if no valid extension
                 output_file += '.mp3'
-                audio.export(output_file, format="mp3")
+                export = functools.partial(self.export_mp3, audio, output_file)
+            
+            # Encode and write in a worker thread so the event loop stays free
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, export)
             
             print(f"✅ Audio saved to {output_file}")
             
         except Exception as e:
             print(f"❌ Error saving audio: {str(e)}")
-            sys.exit(1)
+            raise PodcastGenerationError()
     
-    def generate_podcast(self, topic: str, output_audio_file: str, output_script_file: str, 
+    async def generate_podcast(self, topic: str, output_audio_file: str, output_script_file: str, 
                         host_voice: str, guest_voice: str):
         """Main method to generate complete podcast"""
         print("🎙️ Starting podcast generation...")
         print(f"Topic: {topic}")
         print(f"LLM Provider: {self.llm_provider}")
         print(f"LLM Model: {self.llm_model}")
+        print(f"TTS Model: {self.tts_model}")
+        if self.tts_model in _LANGUAGE_CODE_MODELS:
+            print(f"Language: {self.language}")
+        else:
+            print(f"Language: {self.language} (script only; {self.tts_model} does not support language enforcement)")
         print(f"Host Voice: {host_voice}")
         print(f"Guest Voice: {guest_voice}")
         print("-" * 50)
         
-        # Step 1: Generate script
-        script = self.generate_script(topic)
-        
-        # Step 2: Save raw script
-        self.save_script(script, output_script_file)
-        
-        # Step 3: Parse script
-        dialogue = self.parse_script(script)
-        
-        # Step 4: Generate audio
-        audio = self.generate_full_audio(dialogue, host_voice, guest_voice)
+        # Steps 1-4: Generate, save and parse script while a TTS worker
+        # converts each dialogue line to audio as soon as it is parsed
+        dialogue = asyncio.Queue()
+        audio_task = asyncio.create_task(self.generate_full_audio(dialogue, host_voice, guest_voice))
+        try:
+            script_saved = await self.stream_dialogue(topic, output_script_file, dialogue)
+            audio = await audio_task
+        finally:
+            # If the script failed, stop any TTS requests that are still running
+            audio_task.cancel()
+            await asyncio.gather(audio_task, return_exceptions=True)
+            
+            # Shut the API connections down cleanly while the event loop is still running
+            await self.elevenlabs_http_client.aclose()
+            await self.openai_client.close()
         
-        # Step 5: Save audio
-        self.save_audio(audio, output_audio_file)
+        # Step 5: Save audio, and make sure the script write has finished too
+        await asyncio.gather(script_saved, self.save_audio(audio, output_audio_file))
         
         print("\n" + "=" * 50)
         print("🎉 Podcast generation completed successfully!")
@@ -291,32 +593,51 @@ def main():
                        help="Eleven Labs Voice ID for Host")
     parser.add_argument("--guest_voice", "-gv", default=None,
                        help="Eleven Labs Voice ID for Guest")
+    parser.add_argument("--tts_model", default=TTS_MODEL,
+                       help=f"Eleven Labs model to use (default: {TTS_MODEL})")
+    parser.add_argument("--max_tts_requests", type=int, default=3,
+                       help="Maximum simultaneous Eleven Labs requests; match your plan's concurrency limit (default: 3)")
+    parser.add_argument("--language", "-l", default="en",
+                       help="ISO 639-1 language code for the script and speech (default: en)")
+    parser.add_argument("--no_cache", action="store_true",
+                       help="Ignore cached scripts and audio and always call the APIs")
     
     args = parser.parse_args()
     
+    if args.max_tts_requests < 1:
+        parser.error("--max_tts_requests must be at least 1")
+    
     try:
         # Initialize generator
         generator = PodcastGenerator(
             llm_provider=args.llm_provider,
-            llm_model=args.llm_model
+            llm_model=args.llm_model,
+            use_cache=not args.no_cache,
+            language=args.language,
+            tts_model=args.tts_model,
+            max_tts_requests=args.max_tts_requests
         )
         
         # Use default voices if not specified
         host_voice = args.host_voice or generator.default_host_voice
         guest_voice = args.guest_voice or generator.default_guest_voice
         
-        # Generate podcast
-        generator.generate_podcast(
+        # Generate podcast, on uvloop when it is installed
+        run = uvloop.run if uvloop else asyncio.run
+        run(generator.generate_podcast(
             topic=args.topic,
             output_audio_file=args.output_audio_file,
             output_script_file=args.output_script_file,
             host_voice=host_voice,
             guest_voice=guest_voice
-        )
+        ))
         
     except KeyboardInterrupt:
         print("\n❌ Operation cancelled by user")
         sys.exit(1)
+    except PodcastGenerationError:
+        # The failing step already printed what went wrong
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Unexpected error: {str(e)}")
         sys.exit(1)